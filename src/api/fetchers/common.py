@@ -0,0 +1,110 @@
+import asyncio
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+import pandas as pd
+from nba_api.stats.endpoints import leaguegamelog
+from tqdm.auto import tqdm
+
+
+def to_date(d: Union[str, date]) -> date:
+    if isinstance(d, date):
+        return d
+    return datetime.strptime(d, "%Y-%m-%d").date()
+
+
+def season_for_date(d: date) -> str:
+    if d.month >= 10:
+        end_yy = (d.year + 1) % 100
+        return f"{d.year}-{end_yy:02d}"
+    else:
+        start = d.year - 1
+        end_yy = d.year % 100
+        return f"{start}-{end_yy:02d}"
+
+
+def seasons_between(start: date, end: date) -> List[str]:
+    s0 = season_for_date(start)
+    s1 = season_for_date(end)
+    start_year = int(s0.split("-")[0])
+    end_year = int(s1.split("-")[0])
+    return [f"{y}-{(y + 1) % 100:02d}" for y in range(start_year, end_year + 1)]
+
+
+async def fetch_leaguegamelog_df(
+    season: str, league_id: str = "00", timeout: int = 60, retries: int = 3, p_or_t: str = "T"
+) -> pd.DataFrame:
+    def _call() -> pd.DataFrame:
+        return leaguegamelog.LeagueGameLog(
+            season=season,
+            league_id=league_id,
+            player_or_team_abbreviation=p_or_t,
+            timeout=timeout,
+        ).get_data_frames()[0]
+
+    last_exc: Exception | None = None
+    for attempt in range(retries):
+        try:
+            return await asyncio.to_thread(_call)
+        except Exception as e:
+            last_exc = e
+            await asyncio.sleep(1.5 * (2**attempt))
+    assert last_exc is not None
+    raise last_exc
+
+
+class SeasonFetchError(RuntimeError):
+    """Seasons that still failed after retries, keyed by season."""
+
+    def __init__(self, failed: Dict[str, Exception]):
+        self.failed = failed
+        details = ", ".join(f"{season} ({e!r})" for season, e in failed.items())
+        super().__init__(f"Failed to fetch seasons: {details}")
+
+
+async def fetch_seasons(
+    seasons: List[str],
+    league_id: str = "00",
+    p_or_t: str = "T",
+    max_concurrency: int = 1,
+    show_progress: bool = False,
+    desc: str = "Seasons",
+) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+    """
+    Fetch several seasons concurrently and yield (season, df) as each one arrives.
+
+    At most `max_concurrency` requests are in flight and at most as many fetched
+    frames wait to be consumed, so callers can write each season before the next
+    piles up. stats.nba.com throttles parallel clients, hence the default of 1.
+    Seasons that still fail after retries are skipped; once every other season
+    has been yielded they are raised together as a SeasonFetchError.
+    """
+    pending = list(seasons)
+    failed: Dict[str, Exception] = {}
+    results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+
+    async def _worker() -> None:
+        while pending:
+            season = pending.pop(0)
+            try:
+                df = await fetch_leaguegamelog_df(season, league_id=league_id, p_or_t=p_or_t)
+            except Exception as e:
+                df = e
+            await results.put((season, df))
+
+    workers = [asyncio.create_task(_worker()) for _ in range(min(max_concurrency, len(seasons)))]
+    try:
+        with tqdm(total=len(seasons), disable=not show_progress, desc=desc) as progress:
+            for _ in range(len(seasons)):
+                season, df = await results.get()
+                progress.update()
+                if isinstance(df, Exception):
+                    tqdm.write(f"{desc}: failed to fetch {season} ❌ ({df!r})")
+                    failed[season] = df
+                    continue
+                yield season, df
+    finally:
+        for worker in workers:
+            worker.cancel()
+    if failed:
+        raise SeasonFetchError(failed) from next(iter(failed.values()))
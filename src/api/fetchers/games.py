@@ -1,55 +1,17 @@
-import asyncio
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Any, Union, Tuple, Iterable
+from datetime import date
+from typing import Any, Dict, List, Union
 
 import pandas as pd
-from nba_api.stats.endpoints import leaguegamelog
 from pymongo.errors import BulkWriteError
-from tqdm.auto import tqdm
 
+from .common import SeasonFetchError, fetch_seasons, seasons_between, to_date
 
-def _to_date(d: Union[str, date]) -> date:
-    if isinstance(d, date):
-        return d
-    return datetime.strptime(d, "%Y-%m-%d").date()
 
-
-def _season_for_date(d: date) -> str:
-    if d.month >= 10:
-        end_yy = (d.year + 1) % 100
-        return f"{d.year}-{end_yy:02d}"
-    else:
-        start = d.year - 1
-        end_yy = d.year % 100
-        return f"{start}-{end_yy:02d}"
-
-
-def _seasons_between(start: date, end: date) -> List[str]:
-    s0 = _season_for_date(start)
-    s1 = _season_for_date(end)
-    start_year = int(s0.split("-")[0])
-    start_year = int(s0.split("-")[0])
-    end_year = int(s1.split("-")[0])
-    return [f"{y}-{(y + 1) % 100:02d}" for y in range(start_year, end_year + 1)]
-
-
-async def _fetch_leaguegamelog_df(
-    season: str, league_id: str = "00", timeout: int = 60, retries: int = 3
-) -> pd.DataFrame:
-    def _call() -> pd.DataFrame:
-        return leaguegamelog.LeagueGameLog(
-            season=season, league_id=league_id, timeout=timeout
-        ).get_data_frames()[0]
-
-    last_exc: Exception | None = None
-    for attempt in range(retries):
-        try:
-            return await asyncio.to_thread(_call)
-        except Exception as e:
-            last_exc = e
-            await asyncio.sleep(1.5 * (2**attempt))
-    assert last_exc is not None
-    raise last_exc
+def _int_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Nullable int column, all-missing if the season's log lacks it."""
+    if name not in df:
+        return pd.Series(pd.NA, index=df.index, dtype="Int64")
+    return df[name].astype("Int64")
 
 
 async def _ensure_compound_index(collection) -> None:
@@ -67,60 +29,72 @@ async def sync_games(
     end_date: Union[str, date],
     league_id: str = "00",
     show_progress: bool = False,
+    max_concurrency: int = 1,
 ) -> int:
     """
     Sync team game logs using nba_api.leaguegamelog for seasons covering [start_date, end_date].
     Inserts only missing docs, uniquely keyed by (game_id, team_id). Returns number inserted.
+    Seasons that could not be fetched are raised as SeasonFetchError after the rest are inserted.
     """
-    start = _to_date(start_date)
-    end = _to_date(end_date)
+    start = to_date(start_date)
+    end = to_date(end_date)
     if end < start:
         return 0
 
     collection = db["games"]
     await _ensure_compound_index(collection)
 
-    seasons = _seasons_between(start, end)
-    all_docs: List[Dict[str, Any]] = []
-    seen_keys: set[Tuple[str, int]] = set()
-
-    for season in tqdm(seasons, disable=not show_progress, desc="Seasons"):
-        df = await _fetch_leaguegamelog_df(season, league_id=league_id)
-        if df is None or df.empty:
-            continue
-
-        df["GAME_DATE_PARSED"] = pd.to_datetime(df["GAME_DATE"]).dt.date
-        df = df[(df["GAME_DATE_PARSED"] >= start) & (df["GAME_DATE_PARSED"] <= end)]
-        if df.empty:
-            continue
-
-        for _, row in df.iterrows():
-            gid = str(row["GAME_ID"])
-            tid = int(row["TEAM_ID"])
-            key = (gid, tid)
-            if key in seen_keys:
+    seasons = seasons_between(start, end)
+    frames: Dict[str, pd.DataFrame] = {}
+    fetch_error: SeasonFetchError | None = None
+
+    try:
+        async for season, df in fetch_seasons(
+            seasons, league_id=league_id, p_or_t="T", max_concurrency=max_concurrency,
+            show_progress=show_progress,
+        ):
+            if df is None or df.empty:
                 continue
-            seen_keys.add(key)
 
-            game_date = row["GAME_DATE_PARSED"]
-            pts = row.get("PTS")
-            plus_minus = row.get("PLUS_MINUS")
+            game_dates = pd.to_datetime(df["GAME_DATE"])
+            in_range = game_dates.between(pd.Timestamp(start), pd.Timestamp(end))
+            df, game_dates = df[in_range], game_dates[in_range]
+            if df.empty:
+                continue
 
-            all_docs.append(
+            frames[season] = pd.DataFrame(
                 {
-                    "game_id": gid,
-                    "team_id": tid,
+                    "game_id": df["GAME_ID"].astype(str),
+                    "team_id": df["TEAM_ID"].astype(int),
                     "season": season,
-                    "game_date": game_date.isoformat(),
-                    "result": row.get("WL"),
-                    "points": int(pts) if pd.notna(pts) else None,
-                    "plus_minus": int(plus_minus) if pd.notna(plus_minus) else None,
+                    "game_date": game_dates.dt.strftime("%Y-%m-%d"),
+                    "result": df.get("WL"),
+                    "points": _int_column(df, "PTS"),
+                    "plus_minus": _int_column(df, "PLUS_MINUS"),
                 }
             )
+    except SeasonFetchError as e:
+        # Missing games are picked up on the next sync, so keep what was fetched
+        fetch_error = e
 
-    if not all_docs:
+    inserted = await _insert_missing(collection, frames, seasons)
+    if fetch_error is not None:
+        raise fetch_error
+    return inserted
+
+
+async def _insert_missing(collection, frames: Dict[str, pd.DataFrame], seasons: List[str]) -> int:
+    if not frames:
         return 0
 
+    # Seasons arrive in completion order; concat in season order so the
+    # first-wins dedup below is deterministic
+    games = pd.concat([frames[s] for s in seasons if s in frames], ignore_index=True)
+    games = games.drop_duplicates(subset=["game_id", "team_id"])
+    # Missing stats are stored as null, not NaN/<NA>
+    games = games.astype(object).where(games.notna(), None)
+    all_docs: List[Dict[str, Any]] = games.to_dict(orient="records")
+
     game_ids = list({doc["game_id"] for doc in all_docs})
     existing = await collection.find(
         {"game_id": {"$in": game_ids}}, {"game_id": 1, "team_id": 1, "_id": 0}
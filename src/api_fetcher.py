@@ -1,8 +1,19 @@
+import hashlib
+import os
+import time
+import warnings
+from collections import OrderedDict
+from pathlib import Path
 from typing import Literal
 
 import pandas as pd
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class ApiFetcher:
     """
@@ -10,22 +21,48 @@ class ApiFetcher:
 
     Provides a clean interface for fetching NBA data from the local API server
     that serves as a middleware between the application and external NBA APIs.
+
+    If ``cache_dir`` is given, fetched frames are also stored there as parquet
+    files (requires ``pyarrow``) and reused across sessions. ``cache_ttl`` (seconds,
+    ``None`` keeps them forever) bounds the age of both in-memory and on-disk frames.
     """
 
     BASE_URL = "127.0.0.1:8000/api/"
+    CACHE_SIZE = 16
 
-    def __init__(self, starting_year, ending_year):
+    def __init__(
+        self,
+        starting_year,
+        ending_year,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float | None = 24 * 60 * 60,
+    ):
         self.starting_year = starting_year
         self.ending_year = ending_year
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, pd.DataFrame]] = OrderedDict()
 
     def get_dataframe(
-        self, endpoint: Literal["leaguegamelog", "playergamelogs/all"] = None, **kwargs
+        self,
+        endpoint: Literal["leaguegamelog", "playergamelogs/all"] = None,
+        refresh: bool = False,
+        **kwargs,
     ) -> pd.DataFrame:
         """
         Fetches data from the specified API endpoint and returns it as a pandas DataFrame.
+
+        Responses are memoized per (year range, endpoint, kwargs), in memory and in
+        ``cache_dir`` when set, so repeated calls with the same arguments skip the
+        request; each call gets its own copy of the frame. Only the ``CACHE_SIZE``
+        most recently used frames are kept in memory.
         Args:
             endpoint (Literal["leaguegamelog"], optional):
                 The API endpoint to fetch data from. Must be specified.
+            refresh (bool, optional):
+                Skip the caches, fetch from the API and store the fresh result.
+                Because of this, a query parameter named ``refresh`` cannot be
+                passed through ``kwargs``.
             **kwargs:
                 Additional query parameters to include in the API request.
         Returns:
@@ -40,6 +77,19 @@ class ApiFetcher:
         if endpoint is None:
             raise ValueError("Endpoint must be specified")
 
+        key = self._cache_key(endpoint, kwargs)
+        cached = self._cache.get(key) if key is not None and not refresh else None
+        if cached is not None and not self._expired(cached[0]):
+            self._cache.move_to_end(key)
+            return cached[1].copy()
+
+        path = self._cache_path(endpoint, key)
+        if path is not None and not refresh:
+            stored = self._read_parquet(path)
+            if stored is not None:
+                self._remember(key, *stored)
+                return stored[1].copy()
+
         url = f"http://{self.BASE_URL}{endpoint}"
         params = {
             "starting_year": self.starting_year,
@@ -53,5 +103,74 @@ class ApiFetcher:
                 f"API request failed with status code {response.status_code}"
             )
 
-        data = response.json()
-        return pd.DataFrame(data)
+        data = orjson.loads(response.content) if orjson else response.json()
+        df = pd.DataFrame(data)
+        if path is not None:
+            self._write_parquet(df, path)
+        if key is not None:
+            self._remember(key, time.time(), df)
+        return df.copy()
+
+    def clear_cache(self) -> None:
+        """Drops all in-memory cached frames (files in ``cache_dir`` are kept)."""
+        self._cache.clear()
+
+    def _expired(self, fetched_at: float) -> bool:
+        return self.cache_ttl is not None and time.time() - fetched_at > self.cache_ttl
+
+    def _remember(self, key: tuple, fetched_at: float, df: pd.DataFrame) -> None:
+        self._cache[key] = (fetched_at, df)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _cache_key(self, endpoint: str, kwargs: dict) -> tuple | None:
+        # Lists/sets/dicts (multi-value query params) are frozen into tuples;
+        # anything still unhashable is simply not cached.
+        try:
+            key = (self.starting_year, self.ending_year, endpoint, _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cache_path(self, endpoint: str, key: tuple | None) -> Path | None:
+        if self.cache_dir is None or key is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{endpoint.replace('/', '_')}_{digest}.parquet"
+
+    def _read_parquet(self, path: Path) -> tuple[float, pd.DataFrame] | None:
+        try:
+            fetched_at = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if self._expired(fetched_at):
+            return None
+        try:
+            return fetched_at, pd.read_parquet(path)
+        except Exception as e:  # unreadable cache file: refetch and overwrite it
+            warnings.warn(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+    def _write_parquet(self, df: pd.DataFrame, path: Path) -> None:
+        # Write to a temp file and rename, so an interrupted write never leaves
+        # a truncated file at the final path.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp)
+            os.replace(tmp, path)
+        except Exception as e:  # missing pyarrow, unconvertible columns, disk errors
+            tmp.unlink(missing_ok=True)
+            warnings.warn(f"Could not write cache file {path}: {e}")
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
@@ -0,0 +1,125 @@
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from api_fetcher import ApiFetcher
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = ApiFetcher(starting_year=2022, ending_year=2023)
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(dict(params))
+        body = [{"starting_year": params["starting_year"], "call": len(calls)}]
+        return SimpleNamespace(
+            status_code=200, content=json.dumps(body).encode(), json=lambda: body
+        )
+
+    monkeypatch.setattr("api_fetcher.requests.get", fake_get)
+    fetcher.calls = calls
+    return fetcher
+
+
+def test_repeated_calls_are_served_from_cache(fetcher):
+    first = fetcher.get_dataframe("leaguegamelog", team_id=1)
+    first.loc[0, "call"] = 99
+    second = fetcher.get_dataframe("leaguegamelog", team_id=1)
+
+    assert len(fetcher.calls) == 1
+    assert second.loc[0, "call"] == 1
+
+
+def test_cache_key_includes_year_range(fetcher):
+    fetcher.get_dataframe("leaguegamelog")
+    fetcher.starting_year = 2020
+    df = fetcher.get_dataframe("leaguegamelog")
+
+    assert len(fetcher.calls) == 2
+    assert df.loc[0, "starting_year"] == 2020
+
+
+def test_list_params_are_cached(fetcher):
+    fetcher.get_dataframe("leaguegamelog", team_id=[1, 2])
+    fetcher.get_dataframe("leaguegamelog", team_id=[1, 2])
+
+    assert len(fetcher.calls) == 1
+
+
+def test_refresh_and_clear_cache_refetch(fetcher):
+    fetcher.get_dataframe("leaguegamelog")
+    fetcher.get_dataframe("leaguegamelog", refresh=True)
+    fetcher.clear_cache()
+    fetcher.get_dataframe("leaguegamelog")
+
+    assert len(fetcher.calls) == 3
+
+
+def test_memory_cache_evicts_least_recently_used(fetcher, monkeypatch):
+    monkeypatch.setattr(ApiFetcher, "CACHE_SIZE", 2)
+    fetcher.get_dataframe("leaguegamelog", team_id=1)
+    fetcher.get_dataframe("leaguegamelog", team_id=2)
+    fetcher.get_dataframe("leaguegamelog", team_id=1)
+    fetcher.get_dataframe("leaguegamelog", team_id=3)
+    fetcher.get_dataframe("leaguegamelog", team_id=1)
+    fetcher.get_dataframe("leaguegamelog", team_id=2)
+
+    assert [c["team_id"] for c in fetcher.calls] == [1, 2, 3, 2]
+
+
+def test_expired_memory_cache_is_refetched(fetcher, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("api_fetcher.time.time", lambda: now)
+    fetcher.get_dataframe("leaguegamelog")
+    now += fetcher.cache_ttl + 1
+    df = fetcher.get_dataframe("leaguegamelog")
+
+    assert len(fetcher.calls) == 2
+    assert df.loc[0, "call"] == 2
+
+
+@pytest.fixture
+def disk_fetcher(fetcher, tmp_path):
+    fetcher.cache_dir = tmp_path
+    return fetcher
+
+
+def test_parquet_cache_is_reused_across_instances(disk_fetcher, tmp_path):
+    pytest.importorskip("pyarrow")
+    disk_fetcher.get_dataframe("leaguegamelog")
+    other = ApiFetcher(starting_year=2022, ending_year=2023, cache_dir=tmp_path)
+    df = other.get_dataframe("leaguegamelog")
+
+    assert len(disk_fetcher.calls) == 1
+    assert df.loc[0, "call"] == 1
+    assert [p.suffix for p in tmp_path.iterdir()] == [".parquet"]
+
+
+def test_expired_parquet_cache_is_refetched(disk_fetcher, tmp_path):
+    pytest.importorskip("pyarrow")
+    disk_fetcher.get_dataframe("leaguegamelog")
+    disk_fetcher.clear_cache()
+    (path,) = tmp_path.iterdir()
+    os.utime(path, (0, 0))
+    df = disk_fetcher.get_dataframe("leaguegamelog")
+
+    assert len(disk_fetcher.calls) == 2
+    assert df.loc[0, "call"] == 2
+
+
+def test_failed_cache_write_still_returns_frame(disk_fetcher, tmp_path, monkeypatch):
+    def broken_to_parquet(self, path, *args, **kwargs):
+        Path(path).write_bytes(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", broken_to_parquet)
+    with pytest.warns(UserWarning, match="Could not write cache file"):
+        df = disk_fetcher.get_dataframe("leaguegamelog")
+
+    assert df.loc[0, "call"] == 1
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,61 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from api.fetchers import common
+
+
+async def _collect(gen):
+    return [item async for item in gen]
+
+
+def test_seasons_between_spans_season_boundaries():
+    start = common.to_date("2022-09-15")
+    end = common.to_date("2024-10-02")
+
+    assert common.seasons_between(start, end) == ["2021-22", "2022-23", "2023-24", "2024-25"]
+
+
+def test_fetch_seasons_raises_failed_seasons_after_the_rest(monkeypatch):
+    async def fake_fetch(season, league_id="00", p_or_t="T"):
+        if season == "2022-23":
+            raise ConnectionError("stats.nba.com timed out")
+        return pd.DataFrame({"SEASON": [season]})
+
+    monkeypatch.setattr(common, "fetch_leaguegamelog_df", fake_fetch)
+    seasons = ["2021-22", "2022-23", "2023-24"]
+
+    fetched = []
+
+    async def consume():
+        async for season, df in common.fetch_seasons(seasons, max_concurrency=2):
+            fetched.append((season, df))
+
+    with pytest.raises(common.SeasonFetchError) as excinfo:
+        asyncio.run(consume())
+
+    assert sorted(season for season, _ in fetched) == ["2021-22", "2023-24"]
+    assert all(df["SEASON"].iloc[0] == season for season, df in fetched)
+    assert list(excinfo.value.failed) == ["2022-23"]
+
+
+def test_fetch_seasons_bounds_requests_in_flight(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(season, league_id="00", p_or_t="T"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return pd.DataFrame({"SEASON": [season]})
+
+    monkeypatch.setattr(common, "fetch_leaguegamelog_df", fake_fetch)
+    seasons = [f"{y}-{(y + 1) % 100:02d}" for y in range(2010, 2020)]
+
+    fetched = asyncio.run(_collect(common.fetch_seasons(seasons, max_concurrency=3)))
+
+    assert len(fetched) == len(seasons)
+    assert peak <= 3
@@ -0,0 +1,161 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from api.fetchers import games
+from api.fetchers.common import SeasonFetchError
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, length=None):
+        return list(self._docs)
+
+
+class FakeCollection:
+    def __init__(self, docs=()):
+        self.docs = [dict(d) for d in docs]
+
+    async def index_information(self):
+        return {}
+
+    async def drop_index(self, name):
+        pass
+
+    async def create_index(self, keys, unique=False):
+        return "index"
+
+    def find(self, filt, projection=None):
+        ((field, cond),) = filt.items()
+        matches = [d for d in self.docs if d.get(field) in cond["$in"]]
+        if projection:
+            keep = [k for k, v in projection.items() if v]
+            matches = [{k: d[k] for k in keep} for d in matches]
+        return FakeCursor(matches)
+
+    async def insert_many(self, docs, ordered=True):
+        self.docs.extend(docs)
+        return SimpleNamespace(inserted_ids=list(range(len(docs))))
+
+
+def _log(rows, **overrides):
+    df = pd.DataFrame(
+        rows, columns=["GAME_ID", "TEAM_ID", "GAME_DATE", "WL", "PTS", "PLUS_MINUS"]
+    )
+    for column, values in overrides.items():
+        if values is None:
+            df = df.drop(columns=[column])
+        else:
+            df[column] = values
+    return df
+
+
+@pytest.fixture
+def seasons(monkeypatch):
+    frames = {}
+
+    async def fake_fetch_seasons(season_list, **kwargs):
+        failed = {}
+        # Deliver in reverse, like a later season finishing first
+        for season in reversed(season_list):
+            if isinstance(frames.get(season), Exception):
+                failed[season] = frames[season]
+            elif season in frames:
+                yield season, frames[season]
+        if failed:
+            raise SeasonFetchError(failed)
+
+    monkeypatch.setattr(games, "fetch_seasons", fake_fetch_seasons)
+    return frames
+
+
+def _sync(collection, start="2022-10-01", end="2024-04-30"):
+    return asyncio.run(games.sync_games({"games": collection}, start, end))
+
+
+def test_docs_use_native_types_and_iso_dates(seasons):
+    seasons["2023-24"] = _log(
+        [
+            ["0022300001", 1610612747, "2023-10-24", "W", 119, 12],
+            ["0022300001", 1610612743, "2023-10-24", "L", 107, -12],
+        ]
+    )
+    collection = FakeCollection()
+
+    assert _sync(collection) == 2
+
+    doc = next(d for d in collection.docs if d["team_id"] == 1610612747)
+    assert doc == {
+        "game_id": "0022300001",
+        "team_id": 1610612747,
+        "season": "2023-24",
+        "game_date": "2023-10-24",
+        "result": "W",
+        "points": 119,
+        "plus_minus": 12,
+    }
+    for d in collection.docs:
+        assert type(d["game_id"]) is str
+        assert type(d["team_id"]) is int
+        assert type(d["points"]) is int
+        assert type(d["plus_minus"]) is int
+
+
+def test_missing_values_are_stored_as_none(seasons):
+    seasons["2023-24"] = _log(
+        [["0022300002", 1610612744, "2023-10-25", None, np.nan, None]],
+        PLUS_MINUS=None,
+    )
+    collection = FakeCollection()
+
+    assert _sync(collection) == 1
+
+    (doc,) = collection.docs
+    assert doc["result"] is None
+    assert doc["points"] is None
+    assert doc["plus_minus"] is None
+
+
+def test_duplicate_keys_across_seasons_keep_first(seasons):
+    row = ["0022300003", 1610612738, "2023-04-01", "W", 100, 5]
+    seasons["2022-23"] = _log([row])
+    seasons["2023-24"] = _log([row[:4] + [90, -5]])
+    collection = FakeCollection()
+
+    assert _sync(collection) == 1
+
+    (doc,) = collection.docs
+    assert doc["season"] == "2022-23"
+    assert doc["points"] == 100
+
+
+def test_rows_outside_range_and_existing_docs_are_skipped(seasons):
+    seasons["2023-24"] = _log(
+        [
+            ["0022300004", 1610612737, "2023-11-01", "W", 110, 3],
+            ["0022300005", 1610612737, "2023-11-03", "L", 99, -8],
+            ["0022300006", 1610612737, "2024-05-10", "W", 120, 20],
+        ]
+    )
+    collection = FakeCollection([{"game_id": "0022300004", "team_id": 1610612737}])
+
+    assert _sync(collection) == 1
+
+    assert [d["game_id"] for d in collection.docs] == ["0022300004", "0022300005"]
+
+
+def test_failed_season_is_raised_after_the_rest_are_inserted(seasons):
+    seasons["2022-23"] = ConnectionError("stats.nba.com timed out")
+    seasons["2023-24"] = _log([["0022300007", 1610612737, "2023-11-05", "W", 101, 4]])
+    collection = FakeCollection()
+
+    with pytest.raises(SeasonFetchError) as excinfo:
+        _sync(collection)
+
+    assert list(excinfo.value.failed) == ["2022-23"]
+    assert [d["game_id"] for d in collection.docs] == ["0022300007"]